@@ -7,29 +7,47 @@ This client provides access to all functionality exposed by the API endpoints.
 """
 
 import os
+import re
 import sys
+import stat
+import ssl
+import queue
+import atexit
 import json
 import time
+import random
 import asyncio
 import aiohttp
+import orjson
 import argparse
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+import logging.handlers
+import functools
+from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
+from contextlib import contextmanager
+from collections import OrderedDict
 from datetime import datetime
 from eth_account import Account
-from eth_account.messages import encode_defunct
-from web3 import Web3
+from eth_keys import keys
+from eth_utils import keccak
 from dotenv import load_dotenv
 from pathlib import Path
 import getpass
 import cmd
-import readline
-import textwrap
 from rich.console import Console
-from rich.panel import Panel
-from rich.markdown import Markdown
-from rich.table import Table
-from rich import box
+
+# Console-only modules are imported where used to keep one-shot CLI startup fast
+if TYPE_CHECKING:
+    from rich.markdown import Markdown
+
+# Log file writes go through a queue so they happen on a background thread
+# instead of blocking the event loop
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.FileHandler("echolink_client.log"), respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 # Configure logging
 logging.basicConfig(
@@ -37,7 +55,7 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler("echolink_client.log")
+        logging.handlers.QueueHandler(_log_queue)
     ]
 )
 logger = logging.getLogger(__name__)
@@ -45,9 +63,249 @@ logger = logging.getLogger(__name__)
 # Rich console for pretty output
 console = Console()
 
+# Default total timeout for API requests, in seconds. Chat replies are
+# generated by the agent's model and can take much longer.
+REQUEST_TIMEOUT = 30
+CHAT_TIMEOUT = 300
+
+# Shared HTTP sessions keyed by API base URL, so that connections are reused
+# across clients and commands. Each entry records the event loop it belongs to.
+_SESSIONS: Dict[str, Tuple[asyncio.AbstractEventLoop, aiohttp.ClientSession]] = {}
+
+# Number of clients using each shared session: one per open async context,
+# plus one per client that used it without a context. The latter never
+# release it, so such sessions stay open until close_sessions().
+_SESSION_USERS: Dict[aiohttp.ClientSession, int] = {}
+
+# TLS context shared by all sessions, built on first use
+_SSL_CONTEXT: Optional[ssl.SSLContext] = None
+
+def _get_ssl_context() -> ssl.SSLContext:
+    """
+    Get the shared TLS context, creating it if needed
+    
+    Only HTTP/1.1 is offered via ALPN since aiohttp does not speak HTTP/2.
+    
+    Returns:
+        Default verifying SSL context
+    """
+    global _SSL_CONTEXT
+    if _SSL_CONTEXT is None:
+        context = ssl.create_default_context()
+        context.set_alpn_protocols(["http/1.1"])
+        _SSL_CONTEXT = context
+    return _SSL_CONTEXT
+
+def _get_or_create_session(base_url: str) -> aiohttp.ClientSession:
+    """
+    Get the shared session for an API base URL, creating it if needed
+    
+    Must be called from a running event loop. Nothing here awaits, so
+    concurrent callers on the same loop cannot create duplicate sessions.
+    
+    Args:
+        base_url: API base URL
+        
+    Returns:
+        Shared aiohttp session
+    """
+    loop = asyncio.get_running_loop()
+    entry = _SESSIONS.get(base_url)
+    if entry is not None:
+        owner, session = entry
+        if owner is loop and not session.closed:
+            return session
+    
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=30,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            force_close=False,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+            ssl=_get_ssl_context()
+        ),
+        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    )
+    _SESSIONS[base_url] = (loop, session)
+    return session
+
+def _acquire_session(base_url: str) -> aiohttp.ClientSession:
+    """
+    Get the shared session for an API base URL and register one more user
+    
+    Args:
+        base_url: API base URL
+        
+    Returns:
+        Shared aiohttp session, to be handed back with _release_session
+    """
+    session = _get_or_create_session(base_url)
+    _SESSION_USERS[session] = _SESSION_USERS.get(session, 0) + 1
+    return session
+
+async def _release_session(session: aiohttp.ClientSession) -> None:
+    """
+    Unregister a user of a shared session, closing it after the last one
+    
+    Args:
+        session: Session returned by _acquire_session
+    """
+    users = _SESSION_USERS.get(session, 0) - 1
+    if users > 0:
+        _SESSION_USERS[session] = users
+        return
+    
+    _SESSION_USERS.pop(session, None)
+    for base_url, (_, shared) in list(_SESSIONS.items()):
+        if shared is session:
+            del _SESSIONS[base_url]
+    await session.close()
+
+async def close_sessions() -> None:
+    """
+    Close all shared sessions belonging to the running event loop
+    
+    Clients used as async context managers close their session on exit.
+    Call this before the event loop ends when clients are used without one.
+    """
+    loop = asyncio.get_running_loop()
+    for base_url, (owner, session) in list(_SESSIONS.items()):
+        if owner is loop:
+            del _SESSIONS[base_url]
+            _SESSION_USERS.pop(session, None)
+            await session.close()
+
+@atexit.register
+def _close_sessions_at_exit() -> None:
+    """Close shared sessions still open at interpreter shutdown, where possible"""
+    for base_url, (owner, session) in list(_SESSIONS.items()):
+        if not session.closed and not owner.is_closed() and not owner.is_running():
+            owner.run_until_complete(session.close())
+            del _SESSIONS[base_url]
+
+# orjson turns integers outside the 64-bit range into floats, which would
+# corrupt wei amounts, so bodies with long digit runs use the stdlib decoder
+_LONG_DIGIT_RUN = re.compile(rb"\d{19,}")
+
+def _parse_json(body: bytes) -> Any:
+    """
+    Decode a JSON response body, using orjson only where it is lossless
+    
+    Args:
+        body: Raw response body
+        
+    Returns:
+        Decoded JSON value
+        
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if _LONG_DIGIT_RUN.search(body) is None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # The stdlib also accepts NaN and Infinity, which orjson rejects
+            pass
+    return json.loads(body)
+
+def _format_json(data: Any) -> str:
+    """
+    Pretty-print a value as JSON, falling back to the stdlib for values
+    orjson cannot encode, such as integers outside the 64-bit range
+    
+    Args:
+        data: Value to format
+        
+    Returns:
+        Indented JSON text
+    """
+    try:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(data, indent=2)
+
+@functools.lru_cache(maxsize=128)
+def _render_markdown(text: str) -> "Markdown":
+    """Build a Markdown renderable, reusing the parsed result for repeated text"""
+    from rich.markdown import Markdown
+    
+    return Markdown(text)
+
+class TransactionCache:
+    """Bounded LRU cache of transaction statuses with per-status expiry"""
+    
+    TERMINAL_STATUSES = ("confirmed", "failed")
+    
+    def __init__(self, maxsize: int = 1024, terminal_ttl: float = 3600, pending_ttl: float = 0.25):
+        """
+        Initialize the cache
+        
+        Args:
+            maxsize: Maximum number of transactions kept
+            terminal_ttl: Seconds to keep confirmed or failed statuses
+            pending_ttl: Seconds to keep any other response, including errors.
+                Kept below wait_for_transaction's shortest poll delay so that
+                every poll reaches the server.
+        """
+        self.maxsize = maxsize
+        self.terminal_ttl = terminal_ttl
+        self.pending_ttl = pending_ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+    
+    def get(self, tx_hash: str) -> Optional[Dict]:
+        """
+        Get a cached response if it has not expired
+        
+        Args:
+            tx_hash: Transaction hash
+            
+        Returns:
+            Cached response, or None if missing or expired
+        """
+        entry = self._entries.get(tx_hash)
+        if entry is None:
+            return None
+        
+        fetched_at, response = entry
+        ttl = self.terminal_ttl if response.get("status") in self.TERMINAL_STATUSES else self.pending_ttl
+        if time.monotonic() - fetched_at >= ttl:
+            del self._entries[tx_hash]
+            return None
+        
+        self._entries.move_to_end(tx_hash)
+        return response
+    
+    def set(self, tx_hash: str, response: Dict) -> None:
+        """
+        Store a response, evicting the least recently used entries if full
+        
+        Args:
+            tx_hash: Transaction hash
+            response: Transaction status response
+        """
+        self._entries[tx_hash] = (time.monotonic(), response)
+        self._entries.move_to_end(tx_hash)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
 class EchoLinkClient:
     """Client for interacting with the EV8 API"""
     
+    # Rich allows only one live display at a time, so concurrent
+    # wait_for_transaction calls share a single status spinner
+    _tx_status = None
+    _tx_waiters = 0
+    
     def __init__(self, base_url: str = None, private_key: str = None, load_env: bool = True):
         """
         Initialize the EV8 API client
@@ -68,40 +326,101 @@ class EchoLinkClient:
         # Set base URL from argument or environment or default
         self.base_url = base_url or os.environ.get('EV8_API_URL', 'http://localhost:5000')
         
+        # Fully qualified endpoint URLs, built once
+        self._urls = {
+            "health": f"{self.base_url}/api/v1/health",
+            "balance": f"{self.base_url}/api/v1/balance",
+            "agents": f"{self.base_url}/api/v1/agents",
+            "chat": f"{self.base_url}/api/v1/chat",
+            "config": f"{self.base_url}/api/v1/config",
+            "agent_status": f"{self.base_url}/api/v1/agent/status"
+        }
+        self._tx_url_prefix = f"{self.base_url}/api/v1/transactions/"
+        
         # Set private key from argument or environment
         self.private_key = private_key or os.environ.get('PRIVATE_KEY')
         
         # Initialize account if private key is available
         self.account = None
+        self._signer = None
         if self.private_key:
             self.account = Account.from_key(self.private_key)
+            self._signer = keys.PrivateKey(bytes(self.account.key))
             logger.info(f"Initialized with account address: {self.account.address}")
         
         # Cache for transaction statuses to avoid redundant API calls
-        self.tx_cache = {}
+        self.tx_cache = TransactionCache()
+        
+        # Headers sent with every request; auth adds only the signature fields
+        self._base_headers = {"Content-Type": "application/json"}
+        if self.account:
+            self._base_headers["X-Wallet-Address"] = self.account.address
         
-        # Session for API requests
+        # Last signature headers, keyed by the timestamp they were signed for
+        self._auth_cache: Tuple[int, Optional[Dict[str, str]]] = (0, None)
+        
+        # Shared session for API requests, and the one held by this
+        # client's async context, if any
         self.session = None
+        self._context_session = None
+        
+        # Limit on concurrent in-flight requests, matching the connector's
+        # per-host pool. The semaphore is created on first use so that it
+        # belongs to the running event loop.
+        self._max_inflight = self._parse_max_inflight(os.environ.get('EV8_MAX_INFLIGHT'))
+        self._inflight = None
         
         # Conversation history
         self.conversation_history = []
     
+    @staticmethod
+    def _parse_max_inflight(value: Optional[str], default: int = 30) -> int:
+        """
+        Parse the EV8_MAX_INFLIGHT setting
+        
+        Args:
+            value: Raw setting, or None if unset
+            default: Limit used when the setting is missing or invalid
+            
+        Returns:
+            Concurrent request limit of at least 1
+        """
+        if value is None:
+            return default
+        
+        try:
+            limit = int(value)
+        except ValueError:
+            logger.warning(f"Invalid EV8_MAX_INFLIGHT {value!r}, using {default}")
+            return default
+        
+        if limit < 1:
+            logger.warning(f"EV8_MAX_INFLIGHT must be at least 1, got {limit}; using 1")
+            return 1
+        
+        return limit
+    
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession()
+        self.session = self._context_session = _acquire_session(self.base_url)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit (closes the shared session once unused)"""
+        if self._context_session is not None:
+            await _release_session(self._context_session)
+            self._context_session = None
+        self.session = None
     
-    def _get_auth_headers(self) -> Dict[str, str]:
+    def _get_auth_signature_only(self) -> Dict[str, str]:
         """
-        Create authentication headers for API requests
+        Create the per-request signature headers for authentication
+        
+        The returned dict is cached for the rest of the current second and
+        must not be modified by the caller.
         
         Returns:
-            Dict of headers including authentication
+            Dict with the signature and timestamp headers
         """
         if not self.account:
             logger.error("No private key configured. Authentication will fail.")
@@ -110,63 +429,103 @@ class EchoLinkClient:
         # Create timestamp for message
         timestamp = int(time.time())
         
+        # Reuse the signature if one was already made for this timestamp
+        cached_timestamp, cached_headers = self._auth_cache
+        if cached_headers is not None and cached_timestamp == timestamp:
+            return cached_headers
+        
         # Create message to sign
-        message = f"Authenticate to EchoLink AI: {timestamp}"
-        
-        # Sign message
-        signable_message = encode_defunct(text=message)
-        signature = self.account.sign_message(signable_message)
-        
-        # Return headers
-        return {
-            "X-Wallet-Signature": signature.signature.hex(),
-            "X-Wallet-Address": self.account.address,
-            "X-Auth-Timestamp": str(timestamp),
-            "Content-Type": "application/json"
+        message = f"Authenticate to EchoLink AI: {timestamp}".encode()
+        
+        # Sign the EIP-191 personal message hash directly, as sign_message would
+        msg_hash = keccak(b"\x19Ethereum Signed Message:\n" + str(len(message)).encode() + message)
+        signature = self._signer.sign_msg_hash(msg_hash)
+        
+        # Encode as r || s || v with v in {27, 28}, matching eth_account
+        signature_bytes = (
+            signature.r.to_bytes(32, "big") + signature.s.to_bytes(32, "big") + bytes([signature.v + 27])
+        )
+        
+        # Cache headers for the rest of this second
+        headers = {
+            "X-Wallet-Signature": "0x" + signature_bytes.hex(),
+            "X-Auth-Timestamp": str(timestamp)
         }
+        self._auth_cache = (timestamp, headers)
+        
+        return headers
+    
+    def _get_auth_headers(self) -> Dict[str, str]:
+        """
+        Create authentication headers for API requests
+        
+        Returns:
+            Dict of headers including authentication
+        """
+        return {**self._base_headers, **self._get_auth_signature_only()}
     
     async def _make_request(
-        self, method: str, endpoint: str, data: Dict = None, 
-        auth: bool = True, params: Dict = None
+        self, method: str, url: str, data: Dict = None, 
+        auth: bool = True, params: Dict = None, stream: bool = False,
+        timeout: float = REQUEST_TIMEOUT
     ) -> Tuple[int, Dict]:
         """
         Make an HTTP request to the API
         
         Args:
             method: HTTP method (GET, POST, etc.)
-            endpoint: API endpoint
+            url: Full endpoint URL
             data: Request data
             auth: Whether to include authentication headers
             params: URL parameters
+            stream: Read the body in chunks, for potentially large responses
+            timeout: Total timeout in seconds
             
         Returns:
             Tuple of (status_code, response_data)
         """
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-        
-        # Create URL
-        url = f"{self.base_url}{endpoint}"
+        if self.session is None or self.session.closed:
+            # Outside an async context the session is held until close_sessions()
+            self.session = _acquire_session(self.base_url)
+        if self._inflight is None:
+            self._inflight = asyncio.Semaphore(self._max_inflight)
         
         # Set headers
-        headers = {"Content-Type": "application/json"}
-        if auth:
-            headers.update(self._get_auth_headers())
+        headers = self._get_auth_headers() if auth else self._base_headers
         
         try:
-            # Make request
-            async with self.session.request(
-                method, url, json=data, headers=headers, params=params
+            # Encode the payload with orjson rather than aiohttp's stdlib json
+            payload = orjson.dumps(data) if data is not None else None
+            
+            # Make request once a slot is free
+            async with self._inflight, self.session.request(
+                method, url, data=payload, headers=headers, params=params,
+                timeout=aiohttp.ClientTimeout(total=timeout)
             ) as response:
-                # Parse response
+                # Parse response; non-JSON bodies are returned as the error text
                 status = response.status
-                try:
-                    response_data = await response.json()
-                except:
-                    response_data = {"error": "Failed to parse response"}
+                content_type = response.content_type
+                if content_type == "application/json" or content_type.endswith("+json"):
+                    if stream:
+                        body = bytearray()
+                        async for chunk in response.content.iter_chunked(65536):
+                            body.extend(chunk)
+                    else:
+                        body = await response.read()
+                    try:
+                        response_data = _parse_json(body)
+                    except ValueError:
+                        response_data = {"error": "Failed to parse response"}
+                else:
+                    response_data = {"error": (await response.text(errors="replace"))[:512]}
                 
                 # Return status and data
                 return status, response_data
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            logger.error(f"Request timed out after {timeout}s: {method} {url}")
+            return 500, {"error": f"Request timed out after {timeout} seconds"}
         except Exception as e:
             logger.error(f"Request error: {str(e)}")
             return 500, {"error": str(e)}
@@ -178,7 +537,7 @@ class EchoLinkClient:
         Returns:
             Health status information
         """
-        status, data = await self._make_request("GET", "/api/v1/health", auth=False)
+        status, data = await self._make_request("GET", self._urls["health"], auth=False)
         return data if status == 200 else {"error": data.get("error", "Failed to get health status")}
     
     async def get_balance(self) -> Dict:
@@ -188,7 +547,7 @@ class EchoLinkClient:
         Returns:
             Balance information
         """
-        status, data = await self._make_request("GET", "/api/v1/balance")
+        status, data = await self._make_request("GET", self._urls["balance"])
         return data if status == 200 else {"error": data.get("error", "Failed to get balance")}
     
     async def create_agent(self, name: str, purpose: str) -> Dict:
@@ -213,7 +572,7 @@ class EchoLinkClient:
         }
         
         # Make request
-        status, response = await self._make_request("POST", "/api/v1/agents", data)
+        status, response = await self._make_request("POST", self._urls["agents"], data)
         
         if status == 202:
             return response
@@ -240,14 +599,16 @@ class EchoLinkClient:
         }
         
         # Make request
-        status, response = await self._make_request("POST", "/api/v1/chat", data)
+        status, response = await self._make_request(
+            "POST", self._urls["chat"], data, stream=True, timeout=CHAT_TIMEOUT
+        )
         
         if status == 200:
             # Store in conversation history
             self.conversation_history.append({
                 "user": message, 
                 "agent": response.get("response", ""),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": time.time()
             })
             return response
         else:
@@ -264,17 +625,18 @@ class EchoLinkClient:
             Transaction status
         """
         # Check cache first
-        if tx_hash in self.tx_cache and self.tx_cache[tx_hash].get("status") == "confirmed":
-            return self.tx_cache[tx_hash]
+        cached = self.tx_cache.get(tx_hash)
+        if cached is not None:
+            return cached
         
         # Make request
         status, response = await self._make_request(
-            "GET", f"/api/v1/transactions/{tx_hash}", auth=False
+            "GET", self._tx_url_prefix + tx_hash, auth=False
         )
         
-        # Update cache if successful
-        if status in (200, 202):
-            self.tx_cache[tx_hash] = response
+        # Update cache; unknown transactions are cached briefly as well
+        if status in (200, 202, 404):
+            self.tx_cache.set(tx_hash, response)
         
         return response
     
@@ -290,7 +652,7 @@ class EchoLinkClient:
         """
         # Make request
         status, response = await self._make_request(
-            "GET", "/api/v1/agent/status", params={"address": agent_address}
+            "GET", self._urls["agent_status"], params={"address": agent_address}
         )
         
         return response if status == 200 else {"error": response.get("error", "Failed to check agent status")}
@@ -302,9 +664,25 @@ class EchoLinkClient:
         Returns:
             API configuration
         """
-        status, response = await self._make_request("GET", "/api/v1/config", auth=False)
+        status, response = await self._make_request("GET", self._urls["config"], auth=False)
         return response if status == 200 else {"error": response.get("error", "Failed to get API configuration")}
     
+    @staticmethod
+    @contextmanager
+    def _transaction_status():
+        """Enter the shared transaction status spinner, starting it if needed"""
+        if EchoLinkClient._tx_waiters == 0:
+            EchoLinkClient._tx_status = console.status("[bold green]Processing transaction...")
+            EchoLinkClient._tx_status.start()
+        EchoLinkClient._tx_waiters += 1
+        try:
+            yield EchoLinkClient._tx_status
+        finally:
+            EchoLinkClient._tx_waiters -= 1
+            if EchoLinkClient._tx_waiters == 0:
+                EchoLinkClient._tx_status.stop()
+                EchoLinkClient._tx_status = None
+    
     async def wait_for_transaction(self, tx_hash: str, timeout: int = 300) -> Dict:
         """
         Wait for a transaction to be confirmed
@@ -318,9 +696,12 @@ class EchoLinkClient:
         """
         start_time = time.time()
         
+        # Poll quickly at first, backing off for slow transactions
+        delay = 0.5
+        
         console.print(f"[yellow]Waiting for transaction confirmation: {tx_hash}[/yellow]")
         
-        with console.status("[bold green]Processing transaction...") as status:
+        with self._transaction_status() as status:
             while time.time() - start_time < timeout:
                 # Check transaction status
                 response = await self.check_transaction(tx_hash)
@@ -333,14 +714,33 @@ class EchoLinkClient:
                     console.print("[red]Transaction failed![/red]")
                     return response
                 
-                # Wait before retrying
-                status.update(f"[bold yellow]Waiting for transaction: {time.time() - start_time:.1f}s elapsed[/bold yellow]")
-                await asyncio.sleep(5)
+                # Wait before retrying, with jitter so parallel waiters spread out
+                elapsed = time.time() - start_time
+                status.update(f"[bold yellow]Waiting for transaction: {elapsed:.1f}s elapsed[/bold yellow]")
+                await asyncio.sleep(min(delay + random.uniform(0, delay * 0.1), max(timeout - elapsed, 0)))
+                delay = min(delay * 2, 8.0)
             
             # Timeout
             console.print("[red]Transaction confirmation timeout![/red]")
             return {"error": "Transaction confirmation timed out", "tx_hash": tx_hash}
     
+    async def wait_for_transactions(self, tx_hashes: List[str], timeout: int = 300) -> List[Dict]:
+        """
+        Wait for several transactions to be confirmed concurrently
+        
+        Args:
+            tx_hashes: Transaction hashes
+            timeout: Timeout in seconds, applied to each transaction
+            
+        Returns:
+            Final transaction statuses in the same order as tx_hashes. A
+            transaction whose wait raised is reported by its exception.
+        """
+        return await asyncio.gather(
+            *(self.wait_for_transaction(tx_hash, timeout) for tx_hash in tx_hashes),
+            return_exceptions=True
+        )
+    
     async def create_agent_and_wait(self, name: str, purpose: str) -> Dict:
         """
         Create an agent and wait for confirmation
@@ -368,7 +768,7 @@ class EchoLinkClient:
         Get conversation history
         
         Returns:
-            List of conversation items
+            List of conversation items, with Unix timestamps
         """
         return self.conversation_history
     
@@ -388,18 +788,39 @@ class AsyncEchoLinkConsole(cmd.Cmd):
     """
     prompt = "EV8> "
     
-    def __init__(self, base_url=None, private_key=None):
-        """Initialize the console"""
+    def __init__(self, base_url=None, private_key=None, stdin_stream=True):
+        """
+        Initialize the console
+        
+        Args:
+            base_url: API base URL
+            private_key: Ethereum private key for authentication
+            stdin_stream: Whether piped stdin may be read as an async stream.
+                Pass False if sys.stdin has already been read from, since
+                its buffered data would be skipped.
+        """
         super().__init__()
+        
+        # Enables line editing and history for input() prompts
+        try:
+            import readline  # noqa: F401
+        except ImportError:
+            pass
         self.client = None
         self.base_url = base_url
         self.private_key = private_key
+        self.stdin_stream = stdin_stream
         self.stopped = False
         
+        # Async stdin stream, when the platform supports one
+        self._stdin_reader = None
+        self._stdin_transport = None
+        
     async def setup(self):
         """Initialize the API client"""
         self.client = EchoLinkClient(self.base_url, self.private_key)
         await self.client.__aenter__()
+        await self._connect_stdin()
         
         # Check health to verify connection
         health = await self.client.get_health()
@@ -414,6 +835,92 @@ class AsyncEchoLinkConsole(cmd.Cmd):
             console.print(f"[bold]Block:[/bold] {block}")
             console.print(f"[bold]AI Provider:[/bold] {provider}")
     
+    async def _connect_stdin(self):
+        """Attach piped stdin to the event loop as an async stream where supported"""
+        if not self.stdin_stream:
+            return
+        
+        try:
+            # Terminals keep threaded input(): it has readline editing, and a pipe
+            # transport would make the tty (shared with stdout) non-blocking
+            if sys.stdin.isatty():
+                return
+            
+            # Only pipes and sockets get the stream. Regular files and
+            # non-tty character devices such as /dev/null must not reach
+            # connect_read_pipe: uvloop aborts the process on them rather than
+            # raising.
+            mode = os.fstat(sys.stdin.fileno()).st_mode
+        except (AttributeError, ValueError, OSError):
+            return
+        if not (stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)):
+            return
+        
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        try:
+            # Read from a duplicate so the transport closing at EOF leaves sys.stdin open
+            pipe = os.fdopen(os.dup(sys.stdin.fileno()), "rb", buffering=0)
+        except (AttributeError, ValueError, OSError) as e:
+            logger.debug(f"Using threaded stdin reads: {e}")
+            return
+        
+        try:
+            transport, _ = await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader), pipe
+            )
+        except (NotImplementedError, ValueError, OSError) as e:
+            # Windows event loops cannot read stdin as a pipe
+            pipe.close()
+            logger.debug(f"Using threaded stdin reads: {e}")
+            return
+        
+        self._stdin_reader = reader
+        self._stdin_transport = transport
+    
+    def _disconnect_stdin(self):
+        """Detach the async stdin stream and restore blocking reads"""
+        if self._stdin_transport is None:
+            return
+        
+        self._stdin_transport.close()
+        self._stdin_transport = None
+        self._stdin_reader = None
+        
+        # The pipe transport leaves stdin non-blocking, which breaks input()
+        try:
+            os.set_blocking(sys.stdin.fileno(), True)
+        except (AttributeError, ValueError, OSError):
+            pass
+    
+    async def _input(self, prompt: str = "") -> str:
+        """
+        Read a line from stdin without blocking the event loop
+        
+        Args:
+            prompt: Text written before reading
+            
+        Returns:
+            Line without the trailing newline
+            
+        Raises:
+            EOFError: If stdin reached end of file
+        """
+        if self._stdin_reader is None:
+            return await asyncio.get_running_loop().run_in_executor(None, lambda: input(prompt))
+        
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        try:
+            line = await self._stdin_reader.readline()
+            if not line:
+                raise EOFError
+            return line.decode().rstrip("\n")
+        except ValueError as e:
+            # Over-long lines (already discarded by the reader) and invalid UTF-8
+            console.print(f"[yellow]Ignoring unreadable input line: {e}[/yellow]")
+            return ""
+    
     async def async_cmdloop(self):
         """Async version of cmdloop that properly integrates with asyncio"""
         self.preloop()
@@ -423,13 +930,14 @@ class AsyncEchoLinkConsole(cmd.Cmd):
             while not self.stopped:
                 try:
                     # Get input in a way that doesn't block the event loop
-                    line = await asyncio.get_event_loop().run_in_executor(None, lambda: input(self.prompt))
+                    line = await self._input(self.prompt)
                     await self.async_onecmd(line)
                 except EOFError:
                     self.stopped = True
                     break
         finally:
             self.postloop()
+            self._disconnect_stdin()
             # Clean up client
             if self.client:
                 await self.client.__aexit__(None, None, None)
@@ -474,6 +982,9 @@ class AsyncEchoLinkConsole(cmd.Cmd):
     
     async def async_do_balance(self, arg):
         """Check ETH and EKO balance"""
+        from rich import box
+        from rich.table import Table
+        
         result = await self.client.get_balance()
         
         if "error" in result:
@@ -511,7 +1022,7 @@ class AsyncEchoLinkConsole(cmd.Cmd):
         try:
             # Get multiline input in a way that works with asyncio
             while True:
-                line = await asyncio.get_event_loop().run_in_executor(None, input)
+                line = await self._input()
                 lines.append(line)
         except EOFError:
             pass
@@ -525,6 +1036,8 @@ class AsyncEchoLinkConsole(cmd.Cmd):
     
     async def async_do_chat(self, arg):
         """Send a message to the AI agent"""
+        from rich.panel import Panel
+        
         if not arg:
             console.print("[yellow]Usage: chat <message>[/yellow]")
             return
@@ -538,7 +1051,7 @@ class AsyncEchoLinkConsole(cmd.Cmd):
             metadata = result.get("metadata", {})
             
             # Format response with markdown
-            md = Markdown(response)
+            md = _render_markdown(response)
             console.print(Panel(md, title="Agent Response", border_style="green"))
             
             # Print metadata
@@ -553,7 +1066,7 @@ class AsyncEchoLinkConsole(cmd.Cmd):
         
         while True:
             try:
-                msg = await asyncio.get_event_loop().run_in_executor(None, lambda: input("\nYou: "))
+                msg = await self._input("\nYou: ")
                 if msg.lower() in ('exit', 'quit'):
                     break
                 
@@ -605,8 +1118,9 @@ class AsyncEchoLinkConsole(cmd.Cmd):
         for i, item in enumerate(history, 1):
             console.print(f"\n[bold]--- Message {i} ---[/bold]")
             console.print(f"[bold cyan]You:[/bold cyan] {item['user']}")
-            console.print(f"[bold green]Agent:[/bold green] {item['agent']}")
-            console.print(f"[dim]Time: {item['timestamp']}[/dim]")
+            console.print("[bold green]Agent:[/bold green]")
+            console.print(_render_markdown(item['agent']))
+            console.print(f"[dim]Time: {datetime.fromtimestamp(item['timestamp']).isoformat()}[/dim]")
     
     async def async_do_clear_history(self, arg):
         """Clear conversation history"""
@@ -640,13 +1154,13 @@ class AsyncEchoLinkConsole(cmd.Cmd):
             if "error" in result:
                 console.print(f"[red]Error: {result['error']}[/red]")
             else:
-                console.print(json.dumps(result, indent=2))
+                console.print(_format_json(result))
         else:
             console.print(result)
 
-async def console_mode(base_url=None, private_key=None):
+async def console_mode(base_url=None, private_key=None, stdin_stream=True):
     """Run interactive console with proper async handling"""
-    console_client = AsyncEchoLinkConsole(base_url, private_key)
+    console_client = AsyncEchoLinkConsole(base_url, private_key, stdin_stream)
     await console_client.setup()
     await console_client.async_cmdloop()
 
@@ -663,6 +1177,7 @@ async def main_async():
     parser.add_argument("--chat", help="Send a chat message")
     parser.add_argument("--create", help="Create an agent with the given name")
     parser.add_argument("--purpose", help="Purpose for agent creation")
+    parser.add_argument("--wait-txs", help="Wait for comma-separated transaction hashes to confirm")
     
     args = parser.parse_args()
     
@@ -672,50 +1187,88 @@ async def main_async():
     
     # Initialize client
     private_key = args.key
+    key_prompted = False
     if not private_key and not args.noenv:
         if os.environ.get('PRIVATE_KEY'):
             private_key = os.environ.get('PRIVATE_KEY')
         else:
             console.print("[yellow]No private key provided in arguments or environment[/yellow]")
             private_key = getpass.getpass("Enter private key: ")
+            # Without a controlling terminal getpass reads sys.stdin, which
+            # may buffer input meant for the console
+            key_prompted = True
     
+    try:
+        await run_commands(parser, args, private_key, stdin_stream=not key_prompted)
+    finally:
+        await close_sessions()
+
+async def run_commands(
+    parser: argparse.ArgumentParser, args: argparse.Namespace,
+    private_key: Optional[str], stdin_stream: bool = True
+):
+    """Run the console or the individual commands selected on the command line"""
     # If console mode, start interactive console with proper async handling
     if args.console:
-        await console_mode(args.url, private_key)
+        await console_mode(args.url, private_key, stdin_stream)
         return
     
     # Create client for individual commands
-    async with EchoLinkClient(args.url, private_key, not args.noenv) as client:
-        # Health check
-        if args.health:
-            result = await client.get_health()
-            console.print(json.dumps(result, indent=2))
-        
-        # Balance check
-        if args.balance:
-            result = await client.get_balance()
-            console.print(json.dumps(result, indent=2))
-        
-        # Chat
-        if args.chat:
-            result = await client.send_message(args.chat)
-            console.print(json.dumps(result, indent=2))
-        
-        # Create agent
-        if args.create:
-            if not args.purpose:
-                console.print("[red]Error: --purpose is required for agent creation[/red]")
-                return
-            
-            result = await client.create_agent_and_wait(args.create, args.purpose)
-            console.print(json.dumps(result, indent=2))
+    client = EchoLinkClient(args.url, private_key, not args.noenv)
+    
+    # Independent requests run concurrently
+    coros = []
+    
+    # Health check
+    if args.health:
+        coros.append(client.get_health())
+    
+    # Balance check
+    if args.balance:
+        coros.append(client.get_balance())
+    
+    # Chat
+    if args.chat:
+        coros.append(client.send_message(args.chat))
+    
+    # Print results in the order the commands were listed above
+    for result in await asyncio.gather(*coros, return_exceptions=True):
+        if isinstance(result, Exception):
+            result = {"error": str(result)}
+        console.print(_format_json(result))
+    
+    # Create agent (serial, since it waits on the transaction it submits)
+    if args.create:
+        if not args.purpose:
+            console.print("[red]Error: --purpose is required for agent creation[/red]")
+            return
         
-        # If no commands specified and not console mode, show help
-        if not any([args.health, args.balance, args.chat, args.create, args.console]):
-            parser.print_help()
+        result = await client.create_agent_and_wait(args.create, args.purpose)
+        console.print(_format_json(result))
+    
+    # Wait for transactions
+    if args.wait_txs:
+        tx_hashes = [tx_hash.strip() for tx_hash in args.wait_txs.split(",") if tx_hash.strip()]
+        results = await client.wait_for_transactions(tx_hashes)
+        results = [
+            {"error": str(result), "tx_hash": tx_hash} if isinstance(result, Exception) else result
+            for tx_hash, result in zip(tx_hashes, results)
+        ]
+        console.print(_format_json(results))
+    
+    # If no commands specified and not console mode, show help
+    if not any([args.health, args.balance, args.chat, args.create, args.wait_txs, args.console]):
+        parser.print_help()
 
 def main():
     """Main function for command-line interface"""
+    # Use uvloop's faster event loop where it is installed
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    
     try:
         # Run async main
         asyncio.run(main_async())